@@ -1,13 +1,21 @@
 import asyncio
 import sqlite3
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
 from pathlib import Path
 import os
 import time
-import random
-import datetime
 import logging
+import re
+from urllib.parse import parse_qs, urlparse
+
+# Optional: static listings are read without a browser when these are installed
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    httpx = None
+    HTMLParser = None
 
 # Configure logging
 logging.basicConfig(
@@ -16,70 +24,125 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 logger = logging.getLogger('ai_news')
+logger.addHandler(logging.NullHandler())
 
 # Load environment variables (optional)
 load_dotenv(dotenv_path=Path(".env"))
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Same AI filter the google_search branch of extractCandidate applies
+_AI_TEXT_RE = re.compile(r"ai|artificial intelligence|machine learning|chatgpt|openai", re.I)
+
+# Shared by every save so the connection's statement cache reuses one prepared INSERT.
+# A URL first stored title-only gets its content filled in once it is scraped.
+_INSERT_NEWS_SQL = """
+    INSERT INTO news (title, url, content, source, scraped_date)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(url) DO UPDATE SET content = excluded.content, scraped_date = excluded.scraped_date
+    WHERE news.content = '' AND excluded.content != ''
+"""
+
 # Simple SQLite Database
 class SimpleNewsDB:
     def __init__(self, db_path="ai_news.db"):
         self.db_path = db_path
+        # One long-lived connection; autocommit so each save is its own short transaction
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
         self.init_database()
     
     def init_database(self):
         """Initialize simple database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
+            # WAL + NORMAL sync: one cheap append per commit, readers don't block writers
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-65536")
+            self.conn.execute("PRAGMA busy_timeout=5000")
+            self.conn.execute("PRAGMA mmap_size=268435456")
+
+            self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS news (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
                     url TEXT UNIQUE NOT NULL,
                     content TEXT,
                     source TEXT,
-                    scraped_date TEXT,
+                    scraped_date TEXT DEFAULT CURRENT_TIMESTAMP,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
-            conn.commit()
-            conn.close()
+            # Serves view_saved_news' ORDER BY created_at DESC LIMIT without a full sort
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_news_created_at ON news(created_at DESC)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_news_source ON news(source)")
+            
             logger.info("✅ Database ready")
             
         except Exception as e:
-            logger.error(f"❌ Database error: {e}")
+            logger.error("❌ Database error: %s", e)
     
     def save_news(self, title, url, content, source):
         """Save one news article"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Autocommit connection: the single INSERT is its own transaction
+            cursor = self.conn.execute(_INSERT_NEWS_SQL, (title, url, content, source))
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO news (title, url, content, source, scraped_date)
-                VALUES (?, ?, ?, ?, ?)
-            """, (title, url, content, source, datetime.datetime.now().isoformat()))
+            # Existing URLs are only updated to fill in missing content, never deleted and re-inserted
+            if cursor.rowcount == 0:
+                logger.info("⏭️ Already saved: %.50s...", title)
+                return False
             
-            conn.commit()
-            conn.close()
-            logger.info(f"💾 Saved: {title[:50]}...")
+            logger.info("💾 Saved: %.50s...", title)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Save error: {e}")
+            logger.error("❌ Save error: %s", e)
             return False
 
+    def save_many(self, rows):
+        """Save several (title, url, content, source) rows in one transaction; True if the first row was written"""
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            written = self.conn.execute(_INSERT_NEWS_SQL, rows[0]).rowcount
+            cursor = self.conn.executemany(_INSERT_NEWS_SQL, rows[1:])
+            self.conn.execute("COMMIT")
+            
+            logger.info("💾 Saved or filled %d of %d articles", written + max(cursor.rowcount, 0), len(rows))
+            if not written:
+                logger.info("⏭️ Already saved: %.50s...", rows[0][0])
+            return written > 0
+            
+        except Exception as e:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            logger.error("❌ Save error: %s", e)
+            return False
+
+    def get_content(self, url, max_age_hours=24):
+        """Return stored content for a URL saved within max_age_hours, or None"""
+        try:
+            row = self.conn.execute("""
+                SELECT content FROM news
+                WHERE url = ? AND content != '' AND created_at > datetime('now', ?)
+            """, (url, f"-{max_age_hours} hours")).fetchone()
+            return row[0] if row else None
+            
+        except Exception as e:
+            logger.warning("⚠️ Cache lookup error: %s", e)
+            return None
+
+    def close(self):
+        """Close the database connection"""
+        try:
+            self.conn.close()
+        except Exception as e:
+            logger.warning("⚠️ Database close error: %s", e)
+
 # Initialize database
 db = SimpleNewsDB()
 
-# Helper function
-async def human_delay(min_ms=1000, max_ms=3000):
-    """Human-like delay"""
-    delay = random.randint(min_ms, max_ms) / 1000
-    await asyncio.sleep(delay)
-
 # Main search function
 async def search_trending_ai_news():
     """Search for the most UP-TO-DATE TRENDING AI news and store it"""
@@ -89,7 +152,7 @@ async def search_trending_ai_news():
         async with async_playwright() as p:
             # Launch browser with better stealth settings
             browser = await p.chromium.launch(
-                headless=False,
+                headless=True,
                 args=[
                     '--disable-blink-features=AutomationControlled',
                     '--disable-web-security',
@@ -99,95 +162,92 @@ async def search_trending_ai_news():
             )
             
             context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                user_agent=USER_AGENT
             )
             
-            page = await context.new_page()
+            # Extractors only read text, so skip heavy resources on every page
+            await context.route("**/*", block_heavy_resources)
+            await context.add_init_script(EXTRACT_CANDIDATE_JS)
             
             # Try multiple trending AI news sources
             trending_sources = [
                 {
                     "name": "Google News - AI Trending",
                     "url": "https://news.google.com/search?q=AI%20artificial%20intelligence%20latest%20breaking&hl=en-US&gl=US&ceid=US%3Aen",
-                    "strategy": "google_news"
+                    "strategy": "google_news",
+                    "wait_selector": "article"
                 },
                 {
                     "name": "TechCrunch AI - Latest",
                     "url": "https://techcrunch.com/category/artificial-intelligence/",
-                    "strategy": "techcrunch"
+                    "strategy": "techcrunch",
+                    "wait_selector": "article"
                 },
                 {
                     "name": "Google Search - Today's AI News",  
                     "url": "https://www.google.com/search?q=\"AI+news\"+OR+\"artificial+intelligence\"+today+breaking+latest&tbm=nws&tbs=qdr:d",
-                    "strategy": "google_search"
+                    "strategy": "google_search",
+                    "wait_selector": "a[href][data-ved]"
                 }
             ]
             
-            best_article = None
+            # Fetch all sources concurrently, each on its own page
+            tasks = [
+                asyncio.create_task(fetch_source(context, source))
+                for source in trending_sources
+            ]
             
-            for source in trending_sources:
-                logger.info(f"🔍 Trying {source['name']}...")
-                
+            candidates = []
+            for next_done in asyncio.as_completed(tasks):
+                # One failing source must not abort the others
                 try:
-                    await page.goto(source['url'], wait_until="networkidle", timeout=30000)
-                    await human_delay(2000, 4000)
-                    
-                    # Handle cookie consent
-                    try:
-                        consent_selectors = [
-                            'button:has-text("Accept")',
-                            'button:has-text("I agree")', 
-                            'button:has-text("Accept all")',
-                            '[aria-label*="accept"]',
-                            '.accept-button'
-                        ]
-                        for selector in consent_selectors:
-                            button = await page.query_selector(selector)
-                            if button:
-                                await button.click()
-                                await human_delay(1000, 2000)
-                                break
-                    except:
-                        pass
-                    
-                    # Extract trending articles based on source strategy
-                    if source['strategy'] == 'google_news':
-                        article = await extract_from_google_news(page)
-                    elif source['strategy'] == 'techcrunch':
-                        article = await extract_from_techcrunch(page)
-                    else:  # google_search
-                        article = await extract_from_google_search(page)
-                    
-                    if article:
-                        article['source_type'] = source['name']
-                        article['trending_score'] = calculate_trending_score(article)
-                        
-                        if not best_article or article['trending_score'] > best_article['trending_score']:
-                            best_article = article
-                            logger.info(f"🏆 New best article found: {article['title'][:50]}... (Score: {article['trending_score']})")
-                    
-                    await human_delay(3000, 5000)
-                    
+                    article = await next_done
                 except Exception as e:
-                    logger.warning(f"⚠️ Failed to extract from {source['name']}: {e}")
+                    logger.warning("⚠️ Source failed: %s", e)
+                    continue
+                if not article:
                     continue
+                candidates.append(article)
+                
+                # A clear winner makes the remaining sources irrelevant
+                if article['trending_score'] >= WINNING_SCORE:
+                    logger.info("⚡ Score %d is a clear winner, skipping remaining sources", article['trending_score'])
+                    break
+            
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            best_article = max(candidates, key=lambda a: a['trending_score'], default=None)
             
             if not best_article:
                 logger.error("❌ No trending AI news found from any source")
                 await browser.close()
                 return
             
-            # Get full content of the best trending article
-            logger.info(f"📖 Getting full content for trending article...")
-            best_article = await get_full_article_content(page, best_article)
+            logger.info("🏆 Best article: %.50s... (Score: %d)", best_article['title'], best_article['trending_score'])
             
-            # Save to database
-            success = db.save_news(
-                title=best_article['title'],
-                url=best_article['url'],
-                content=best_article.get('content', ''),
-                source=best_article.get('source', 'Unknown')
-            )
+            # Get full content of the best trending article, unless it's too weak to be worth a navigation
+            if best_article['trending_score'] < MIN_CONTENT_SCORE:
+                logger.info("⏭️ Low score (%d), skipping full content fetch", best_article['trending_score'])
+            else:
+                logger.info("📖 Getting full content for trending article...")
+                page = await context.new_page()
+                best_article = await get_full_article_content(page, best_article)
+            
+            # Save all candidates in one transaction, best article first so its content wins.
+            # Placeholder text from a failed scrape is stored as '' so a later run can fill it in.
+            rows = [(
+                best_article['title'],
+                best_article['url'],
+                best_article.get('content', '') if best_article.get('content_extracted') else '',
+                best_article.get('source', 'Unknown')
+            )]
+            rows += [
+                (a['title'], a['url'], a.get('content', ''), a.get('source', 'Unknown'))
+                for a in candidates if a is not best_article
+            ]
+            success = db.save_many(rows)
             
             if success:
                 print("\n" + "="*70)
@@ -202,178 +262,324 @@ async def search_trending_ai_news():
                 print(f"🚀 Found via: {best_article['source_type']}")
                 print("="*70)
             else:
-                print("❌ Failed to save article")
+                print("❌ Article not saved (already stored or save error)")
             
-            await human_delay(2000, 3000)
             await browser.close()
             
     except Exception as e:
-        logger.error(f"❌ Search failed: {e}")
+        logger.error("❌ Search failed: %s", e)
         print("❌ Search failed. Please check your internet connection and try again.")
 
-async def extract_from_google_news(page):
-    """Extract trending article from Google News"""
-    try:
-        article = await page.evaluate("""
-            () => {
-                // Look for the first news article in Google News
-                const articles = document.querySelectorAll('article, [data-n-tid]');
-                
-                for (let article of articles) {
-                    const titleElement = article.querySelector('h3, h4, [role="heading"]');
-                    const linkElement = article.querySelector('a[href*="http"]');
-                    
-                    if (titleElement && linkElement) {
-                        const title = titleElement.innerText || titleElement.textContent || '';
-                        const url = linkElement.href;
-                        
-                        if (title.length > 10 && url.includes('http')) {
-                            return {
-                                title: title.trim(),
-                                url: url,
-                                source: 'Google News'
-                            };
-                        }
-                    }
-                }
-                return null;
-            }
-        """)
+# Resources the text extractors never read
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_AD_HOSTS = ("doubleclick.net", "googlesyndication.com", "googletagmanager.com", "google-analytics.com")
+
+async def block_heavy_resources(route):
+    """Abort images, fonts, media, CSS and ad/analytics requests"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_AD_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Caps concurrent source fetches so a growing source list doesn't hammer origins
+_SEM = asyncio.Semaphore(3)
+
+# A source that already used up its whole timeout is hung, not flaky
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, PlaywrightTimeoutError) + ((httpx.TimeoutException,) if httpx else ())
+
+async def retry(coro_fn, tries=3):
+    """Await coro_fn(), retrying fast failures with exponential backoff; timeouts are raised at once"""
+    for attempt in range(tries):
+        try:
+            return await coro_fn()
+        except _TIMEOUT_ERRORS:
+            raise
+        except Exception:
+            if attempt == tries - 1:
+                raise
+            await asyncio.sleep(0.2 * 2 ** attempt)
+
+# Listing pages that are server-rendered and can be read without a browser
+STATIC_STRATEGIES = {"techcrunch", "google_search"}
+
+async def fetch_source(context, source):
+    """Fetch one trending source and return its scored article"""
+    async with _SEM:
+        logger.info("🔍 Trying %s...", source['name'])
+        
+        article = None
+        if source['strategy'] in STATIC_STRATEGIES:
+            article = await fetch_static(source)
+        if not article:
+            article = await fetch_playwright(context, source)
+        
+        if article:
+            article['source_type'] = source['name']
+            article['trending_score'] = calculate_trending_score(article)
+            logger.info("✅ %s: %.50s... (Score: %d)", source['name'], article['title'], article['trending_score'])
+        
         return article
+
+async def fetch_static(source):
+    """Read a server-rendered listing with httpx + selectolax, without a browser"""
+    if httpx is None or HTMLParser is None:
+        return None
+    
+    try:
+        async with httpx.AsyncClient(headers={'User-Agent': USER_AGENT}, follow_redirects=True, timeout=15) as client:
+            response = await retry(lambda: client.get(source['url']))
+            response.raise_for_status()
+        
+        tree = HTMLParser(response.text)
+        if source['strategy'] == 'techcrunch':
+            return extract_static_techcrunch(tree)
+        return extract_static_google_search(tree)
+        
     except Exception as e:
-        logger.warning(f"Error extracting from Google News: {e}")
+        logger.warning("⚠️ Static fetch failed for %s, falling back to browser: %s", source['name'], e)
         return None
 
-async def extract_from_techcrunch(page):
-    """Extract latest article from TechCrunch AI"""
+def extract_static_techcrunch(tree):
+    """Static-HTML twin of the techcrunch branch of extractCandidate"""
+    for node in tree.css('article, .post-block, .wp-block-tc23-post-picker'):
+        link = node.css_first('h2 a, h3 a, .post-block__title a')
+        if not link:
+            continue
+        
+        title = link.text(separator=' ', strip=True)
+        url = link.attributes.get('href') or ''
+        if len(title) > 10 and url:
+            return {
+                'title': title,
+                'url': url if url.startswith('http') else 'https://techcrunch.com' + url,
+                'source': 'TechCrunch'
+            }
+    return None
+
+def extract_static_google_search(tree):
+    """Static-HTML twin of the google_search branch of extractCandidate"""
+    for link in tree.css('a[href]'):
+        href = link.attributes.get('href') or ''
+        # Without JS, result links are wrapped as /url?q=<target>
+        if href.startswith('/url?'):
+            href = parse_qs(urlparse(href).query).get('q', [''])[0]
+        text = link.text(separator=' ', strip=True)
+        
+        if (href.startswith('http') and
+                'google.com' not in href and
+                'youtube.com' not in href and
+                15 < len(text) < 300 and
+                _AI_TEXT_RE.search(text)):
+            return {
+                'title': text,
+                'url': href,
+                'source': 'Google Search'
+            }
+    return None
+
+async def fetch_playwright(context, source):
+    """Open a page for one trending source and extract its article in the browser"""
+    page = None
     try:
-        article = await page.evaluate("""
-            () => {
-                // Look for TechCrunch articles
-                const articles = document.querySelectorAll('article, .post-block, .wp-block-tc23-post-picker');
+        page = await context.new_page()
+        await retry(lambda: page.goto(source['url'], wait_until="domcontentloaded", timeout=30000))
+        try:
+            await page.wait_for_selector(source['wait_selector'], timeout=5000)
+        except Exception:
+            logger.warning("⚠️ %s: '%s' not found, extracting anyway", source['name'], source['wait_selector'])
+        if "google" in source['url']:
+            # Brief pause on Google properties only, to stay clear of bot checks
+            await asyncio.sleep(0.5)
+        
+        # Handle cookie consent
+        try:
+            consent_selectors = [
+                'button:has-text("Accept")',
+                'button:has-text("I agree")', 
+                'button:has-text("Accept all")',
+                '[aria-label*="accept"]',
+                '.accept-button'
+            ]
+            for selector in consent_selectors:
+                button = await page.query_selector(selector)
+                if button:
+                    await button.click()
+                    break
+        except:
+            pass
+        
+        # Extract trending articles based on source strategy
+        return await extract_candidate(page, source)
+        
+    except Exception as e:
+        logger.warning("⚠️ Failed to extract from %s: %s", source['name'], e)
+        return None
+    finally:
+        if page:
+            await page.close()
+
+# One extractor for every listing strategy, installed once per context
+EXTRACT_CANDIDATE_JS = """
+    window.extractCandidate = (strategy) => {
+        if (strategy === 'google_news') {
+            // Look for the first news article in Google News
+            const articles = document.querySelectorAll('article, [data-n-tid]');
+            
+            for (let article of articles) {
+                const titleElement = article.querySelector('h3, h4, [role="heading"]');
+                const linkElement = article.querySelector('a[href*="http"]');
                 
-                for (let article of articles) {
-                    const titleElement = article.querySelector('h2 a, h3 a, .post-block__title a');
+                if (titleElement && linkElement) {
+                    const title = titleElement.innerText || titleElement.textContent || '';
+                    const url = linkElement.href;
                     
-                    if (titleElement) {
-                        const title = titleElement.innerText || titleElement.textContent || '';
-                        const url = titleElement.href;
-                        
-                        if (title.length > 10 && url) {
-                            return {
-                                title: title.trim(),
-                                url: url.startsWith('http') ? url : 'https://techcrunch.com' + url,
-                                source: 'TechCrunch'
-                            };
-                        }
+                    if (title.length > 10 && url.includes('http')) {
+                        return {
+                            title: title.trim(),
+                            url: url,
+                            source: 'Google News'
+                        };
                     }
                 }
-                return null;
             }
-        """)
-        return article
-    except Exception as e:
-        logger.warning(f"Error extracting from TechCrunch: {e}")
-        return None
-
-async def extract_from_google_search(page):
-    """Extract trending article from Google Search News results"""
-    try:
-        article = await page.evaluate("""
-            () => {
-                // Look for news results in Google Search
-                const links = Array.from(document.querySelectorAll('a[href]'));
+            return null;
+        }
+        
+        if (strategy === 'techcrunch') {
+            // Look for TechCrunch articles
+            const articles = document.querySelectorAll('article, .post-block, .wp-block-tc23-post-picker');
+            
+            for (let article of articles) {
+                const titleElement = article.querySelector('h2 a, h3 a, .post-block__title a');
                 
-                for (let link of links) {
-                    const href = link.href;
-                    const text = link.innerText || link.textContent || '';
+                if (titleElement) {
+                    const title = titleElement.innerText || titleElement.textContent || '';
+                    const url = titleElement.href;
                     
-                    // Check if it's a valid news link with AI-related content
-                    if (href && 
-                        href.includes('http') && 
-                        !href.includes('google.com') &&
-                        !href.includes('youtube.com') &&
-                        text.length > 15 &&
-                        text.length < 300) {
-                        
-                        const lowerText = text.toLowerCase();
-                        if (lowerText.includes('ai') || 
-                            lowerText.includes('artificial intelligence') ||
-                            lowerText.includes('machine learning') ||
-                            lowerText.includes('chatgpt') ||
-                            lowerText.includes('openai')) {
-                            
-                            return {
-                                title: text.trim(),
-                                url: href,
-                                source: 'Google Search'
-                            };
-                        }
+                    if (title.length > 10 && url) {
+                        return {
+                            title: title.trim(),
+                            url: url.startsWith('http') ? url : 'https://techcrunch.com' + url,
+                            source: 'TechCrunch'
+                        };
                     }
                 }
-                return null;
             }
-        """)
-        return article
+            return null;
+        }
+        
+        // google_search: look for news results in Google Search
+        const links = Array.from(document.querySelectorAll('a[href]'));
+        
+        for (let link of links) {
+            const href = link.href;
+            const text = link.innerText || link.textContent || '';
+            
+            // Check if it's a valid news link with AI-related content
+            if (href && 
+                href.includes('http') && 
+                !href.includes('google.com') &&
+                !href.includes('youtube.com') &&
+                text.length > 15 &&
+                text.length < 300) {
+                
+                const lowerText = text.toLowerCase();
+                if (lowerText.includes('ai') || 
+                    lowerText.includes('artificial intelligence') ||
+                    lowerText.includes('machine learning') ||
+                    lowerText.includes('chatgpt') ||
+                    lowerText.includes('openai')) {
+                    
+                    return {
+                        title: text.trim(),
+                        url: href,
+                        source: 'Google Search'
+                    };
+                }
+            }
+        }
+        return null;
+    };
+"""
+
+async def extract_candidate(page, source):
+    """Extract the trending candidate article using the source's strategy"""
+    try:
+        return await page.evaluate("extractCandidate", source['strategy'])
     except Exception as e:
-        logger.warning(f"Error extracting from Google Search: {e}")
+        logger.warning("Error extracting from %s: %s", source['name'], e)
         return None
 
+# High trending keywords
+TRENDING_KEYWORDS = [
+    'breaking', 'just in', 'latest', 'new', 'announces', 'launches',
+    'today', 'this week', 'now', 'update', 'development',
+    'breakthrough', 'major', 'revolutionary', 'game-changing'
+]
+
+# AI company mentions (more relevant/trending)
+AI_COMPANIES = [
+    'openai', 'google', 'microsoft', 'meta', 'apple', 'nvidia',
+    'anthropic', 'deepmind', 'hugging face', 'stability ai'
+]
+
+# Hot AI topics
+HOT_TOPICS = [
+    'gpt', 'chatgpt', 'claude', 'gemini', 'llama', 'copilot',
+    'agi', 'autonomous', 'robotics', 'ai safety', 'regulation'
+]
+
+# Score at which an article is guaranteed to be picked
+WINNING_SCORE = 80
+
+# Below this score only the title is saved, without fetching the full article
+MIN_CONTENT_SCORE = 20
+
+# Bonus for source reliability, keyed by the lowercased source the extractors report
+_SOURCE_BONUS = {'techcrunch': 10, 'google news': 15}
+
+def _keyword_regex(keywords):
+    """Compile keywords into one zero-width alternation that also finds nested keywords ('gpt' inside 'chatgpt')"""
+    return re.compile("(?=(" + "|".join(map(re.escape, sorted(keywords, key=len, reverse=True))) + "))")
+
+_TRENDING_RE = _keyword_regex(TRENDING_KEYWORDS)
+_COMPANIES_RE = _keyword_regex(AI_COMPANIES)
+_TOPICS_RE = _keyword_regex(HOT_TOPICS)
+
 def calculate_trending_score(article):
     """Calculate how trending/recent an article is"""
     score = 0
     title = article.get('title', '').lower()
     
-    # High trending keywords
-    trending_keywords = [
-        'breaking', 'just in', 'latest', 'new', 'announces', 'launches',
-        'today', 'this week', 'now', 'update', 'development',
-        'breakthrough', 'major', 'revolutionary', 'game-changing'
-    ]
-    
-    # AI company mentions (more relevant/trending)
-    ai_companies = [
-        'openai', 'google', 'microsoft', 'meta', 'apple', 'nvidia',
-        'anthropic', 'deepmind', 'hugging face', 'stability ai'
-    ]
-    
-    # Hot AI topics
-    hot_topics = [
-        'gpt', 'chatgpt', 'claude', 'gemini', 'llama', 'copilot',
-        'agi', 'autonomous', 'robotics', 'ai safety', 'regulation'
-    ]
-    
-    # Score based on trending keywords
-    for keyword in trending_keywords:
-        if keyword in title:
-            score += 20
-    
-    # Score based on AI companies
-    for company in ai_companies:
-        if company in title:
-            score += 15
-    
-    # Score based on hot topics
-    for topic in hot_topics:
-        if topic in title:
-            score += 10
+    # One overlapping regex scan per category; each distinct keyword counts once, as with `in`
+    score += 20 * len(set(_TRENDING_RE.findall(title)))
+    score += 15 * len(set(_COMPANIES_RE.findall(title)))
+    score += 10 * len(set(_TOPICS_RE.findall(title)))
     
     # Bonus for source reliability
-    source = article.get('source', '').lower()
-    if 'techcrunch' in source:
-        score += 10
-    elif 'google news' in source:
-        score += 15
+    score += _SOURCE_BONUS.get(article.get('source', '').lower(), 0)
     
     return score
 
 async def get_full_article_content(page, article):
     """Get full content of the trending article"""
-    logger.info(f"📖 Getting full content for: {article['title'][:50]}...")
+    logger.info("📖 Getting full content for: %.50s...", article['title'])
+    
+    # Reuse content scraped on a recent run instead of navigating again
+    cached = db.get_content(article['url'])
+    if cached:
+        logger.info("♻️ Using cached content (%d chars)", len(cached))
+        article['content'] = cached
+        article['content_extracted'] = True
+        return article
     
     try:
-        await page.goto(article['url'], wait_until="networkidle", timeout=30000)
-        await human_delay(2000, 4000)
+        await page.goto(article['url'], wait_until="domcontentloaded", timeout=30000)
+        try:
+            await page.wait_for_selector("article, main, p", timeout=5000)
+        except Exception:
+            logger.warning("⚠️ Article body not found, extracting anyway")
         
         # Extract full article content with better selectors
         content = await page.evaluate("""
@@ -395,9 +601,10 @@ async def get_full_article_content(page, article):
                 for (const selector of selectors) {
                     const element = document.querySelector(selector);
                     if (element) {
-                        const text = element.innerText || element.textContent || '';
+                        // innerText keeps block breaks and leaves inline scripts out
+                        const text = element.innerText || '';
                         if (text.length > 200) {
-                            return text.trim();
+                            return text.trim().slice(0, 3000);
                         }
                     }
                 }
@@ -405,33 +612,32 @@ async def get_full_article_content(page, article):
                 // Fallback: try to get main content area
                 const main = document.querySelector('main');
                 if (main) {
-                    const text = main.innerText || main.textContent || '';
+                    const text = main.innerText || '';
                     if (text.length > 200) {
-                        return text.trim();
+                        return text.trim().slice(0, 3000);
                     }
                 }
                 
-                // Last resort: body content (filtered)
-                const bodyText = document.body.innerText || document.body.textContent || '';
-                return bodyText.length > 100 ? bodyText.trim() : 'Content extraction limited';
+                // Last resort: body content (innerText keeps inline scripts out)
+                const bodyText = document.body.innerText || '';
+                return bodyText.length > 100 ? bodyText.trim().slice(0, 3000) : '';
             }
         """)
         
         # Get source domain
         source = await page.evaluate("() => window.location.hostname")
         
-        # Limit content length for storage
-        if len(content) > 3000:
-            content = content[:3000] + "..."
+        if not content:
+            raise ValueError("no article text on page")
         
         article['content'] = content
         article['source'] = source
         article['content_extracted'] = True
         
-        logger.info(f"✅ Successfully extracted content ({len(content)} chars)")
+        logger.info("✅ Successfully extracted content (%d chars)", len(content))
         
     except Exception as e:
-        logger.error(f"❌ Error getting full content: {e}")
+        logger.error("❌ Error getting full content: %s", e)
         article['content'] = f"Trending AI article from {article.get('source', 'unknown source')}. Full content extraction failed."
         article['content_extracted'] = False
     
@@ -441,18 +647,12 @@ async def get_full_article_content(page, article):
 def view_saved_news():
     """View the saved news from database"""
     try:
-        conn = sqlite3.connect("ai_news.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        articles = db.conn.execute("""
             SELECT title, url, source, scraped_date, content 
             FROM news 
             ORDER BY created_at DESC 
             LIMIT 5
-        """)
-        
-        articles = cursor.fetchall()
-        conn.close()
+        """).fetchall()
         
         if articles:
             print(f"\n📚 SAVED NEWS ({len(articles)} articles):")
@@ -471,7 +671,7 @@ def view_saved_news():
             print("📭 No saved articles found")
             
     except Exception as e:
-        logger.error(f"❌ Error viewing news: {e}")
+        logger.error("❌ Error viewing news: %s", e)
 
 # Main execution
 if __name__ == "__main__":
@@ -496,6 +696,8 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("⚠️ Process stopped by user")
     except Exception as e:
-        logger.error(f"❌ Error: {e}")
+        logger.error("❌ Error: %s", e)
+    finally:
+        db.close()
         
     print("\n✅ Done!")
\ No newline at end of file
@@ -10,6 +10,9 @@ import datetime
 import logging
 import re
 import hashlib
+import atexit
+import functools
+import sys
 
 # Configure logging
 logging.basicConfig(
@@ -22,17 +25,86 @@ logger = logging.getLogger('ai_news')
 # Load environment variables (optional)
 load_dotenv(dotenv_path=Path(".env"))
 
+# Text helpers used by SimpleNewsDB, defined before the module-level db is created
+def make_content_hash(hash_input):
+    """Hash used for duplicate detection; BLAKE2b-128 is faster than MD5 and not security-relevant here"""
+    return hashlib.blake2b(hash_input.encode("utf-8"), digest_size=16).hexdigest()
+
+# Whitespace, NULs and typographic punctuation normalized in one translate pass
+_CLEAN_TRANS = str.maketrans({
+    '\x00': '', '\r': ' ', '\n': ' ', '\t': ' ',
+    '\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'",
+    '\u2013': '-', '\u2014': '-', '\u2026': '...'
+})
+_CTRL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+def clean_text_for_db(text):
+    """Clean any text before database insertion"""
+    if not text:
+        return ""
+    
+    try:
+        text = str(text).translate(_CLEAN_TRANS)
+        text = _CTRL_RE.sub('', text)
+        return ' '.join(text.split())
+        
+    except Exception as e:
+        logger.error(f"Text cleaning failed: {e}")
+        return "Text cleaning failed"
+
+# Shared by every save. A URL first stored title-only gets its content filled in once scraped,
+# unless that content is already stored under another URL.
+_INSERT_NEWS_SQL = """
+    INSERT OR IGNORE INTO news (title, url, content, summarize, source, scraped_date, content_hash)
+    VALUES (?, ?, ?, ?, ?, datetime('now'), ?)
+    ON CONFLICT(url) DO UPDATE SET
+        content = excluded.content, summarize = excluded.summarize,
+        scraped_date = excluded.scraped_date, content_hash = excluded.content_hash
+    WHERE news.content = '' AND excluded.content != ''
+        AND NOT EXISTS (SELECT 1 FROM news WHERE content_hash = excluded.content_hash)
+"""
+
 # Simple SQLite Database
 class SimpleNewsDB:
     def __init__(self, db_path="ai_news.db"):
         self.db_path = db_path
+        self._conn = None
+        self._url_set = set()
+        atexit.register(self.close)
         self.init_database()
     
+    def _connect(self):
+        """Open the shared autocommit connection and tune it once"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        
+        # WAL is stored in the file; the rest tune this connection
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=30000000")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    
+    def close(self):
+        """Run PRAGMA optimize and close the shared connection"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+        finally:
+            # Close even when optimize fails, so the file is never moved with a connection still open
+            self._conn.close()
+            self._conn = None
+    
     def init_database(self):
         """Initialize simple database with summarize column and handle migration"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            if self._conn is None:
+                self._conn = self._connect()
+            cursor = self._conn.cursor()
             
             # Create table with all columns
             cursor.execute("""
@@ -43,7 +115,7 @@ class SimpleNewsDB:
                     content TEXT,
                     summarize TEXT,
                     source TEXT,
-                    scraped_date TEXT,
+                    scraped_date TEXT DEFAULT (datetime('now')),
                     content_hash TEXT UNIQUE,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -61,8 +133,26 @@ class SimpleNewsDB:
                 logger.info("🔧 Adding missing 'content_hash' column...")
                 cursor.execute("ALTER TABLE news ADD COLUMN content_hash TEXT")
             
-            conn.commit()
-            conn.close()
+            # content_hash is only UNIQUE in the CREATE TABLE; databases that gained it via ALTER need the index
+            try:
+                cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_news_content_hash ON news(content_hash)")
+            except sqlite3.IntegrityError as e:
+                logger.warning(f"Could not index content_hash, duplicate hashes stored: {e}")
+            
+            # Content hashes switched from MD5 to BLAKE2b in schema version 1; rehash older rows once
+            if cursor.execute("PRAGMA user_version").fetchone()[0] < 1:
+                # A failed rehash keeps the stored rows; it must not fall through to create_fresh_database
+                try:
+                    self.migrate_content_hashes(cursor)
+                except Exception as e:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    logger.error(f"❌ Content hash migration failed, keeping existing hashes: {e}")
+            
+            # Known URLs live in memory so duplicate checks skip SQLite entirely; title-only rows
+            # stay out so a later run can pick them again and fill in their content
+            self._url_set = {row[0] for row in cursor.execute("SELECT url FROM news WHERE content != ''")}
+            
             logger.info("✅ Database ready with all required columns")
             
         except Exception as e:
@@ -72,105 +162,132 @@ class SimpleNewsDB:
     
     def create_fresh_database(self):
         """Create a fresh database if migration fails"""
-        try:
-            logger.info("🔄 Creating fresh database...")
-            # Backup old database
-            backup_path = f"{self.db_path}.backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            if os.path.exists(self.db_path):
-                os.rename(self.db_path, backup_path)
-                logger.info(f"📦 Old database backed up to: {backup_path}")
-            
-            # Create new database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                CREATE TABLE news (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    url TEXT UNIQUE NOT NULL,
-                    content TEXT,
-                    summarize TEXT,
-                    source TEXT,
-                    scraped_date TEXT,
-                    content_hash TEXT UNIQUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
-            conn.close()
-            logger.info("✅ Fresh database created successfully")
-            
-        except Exception as e:
-            logger.error(f"❌ Fresh database creation failed: {e}")
-            # Try to create a fresh database if migration fails
-            self.create_fresh_database()
+        # One retry at most, then give up instead of recursing
+        backup_path = f"{self.db_path}.backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        moved_aside = False
+        for attempt in range(2):
+            try:
+                logger.info("🔄 Creating fresh database...")
+                # Release the file before moving it aside
+                self.close()
+                
+                # Backup old database once, WAL sidecars included and the main file last, so it only
+                # counts as moved once it really is; a retry only discards the half-built files
+                if not moved_aside:
+                    for suffix in ("-wal", "-shm", ""):
+                        if os.path.exists(self.db_path + suffix):
+                            os.rename(self.db_path + suffix, backup_path + suffix)
+                    moved_aside = True
+                    if os.path.exists(backup_path):
+                        logger.info(f"📦 Old database backed up to: {backup_path}")
+                else:
+                    for suffix in ("", "-wal", "-shm"):
+                        if os.path.exists(self.db_path + suffix):
+                            os.remove(self.db_path + suffix)
+                
+                # Create new database
+                self._url_set = set()
+                self._conn = self._connect()
+                cursor = self._conn.cursor()
+                cursor.execute("PRAGMA user_version = 1")
+                
+                cursor.execute("""
+                    CREATE TABLE news (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        url TEXT UNIQUE NOT NULL,
+                        content TEXT,
+                        summarize TEXT,
+                        source TEXT,
+                        scraped_date TEXT DEFAULT (datetime('now')),
+                        content_hash TEXT UNIQUE,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                logger.info("✅ Fresh database created successfully")
+                return
+                
+            except Exception as e:
+                logger.error(f"❌ Fresh database creation failed: {e}")
+                self.close()
+                if attempt:
+                    raise
     
-    def is_duplicate(self, title, content):
-        """Check if article already exists"""
-        try:
-            # Create hash of title + first 200 chars of content
-            content_snippet = content[:200] if content else ""
+    def migrate_content_hashes(self, cursor):
+        """Recompute every stored content_hash with make_content_hash and bump user_version"""
+        logger.info("🔧 Rehashing stored articles...")
+        rows = cursor.execute("SELECT id, title, content FROM news").fetchall()
+        
+        updates = []
+        for row_id, title, content in rows:
+            content_snippet = content[:200] if content else title
             hash_input = f"{title.lower().strip()}{content_snippet.lower().strip()}"
-            content_hash = hashlib.md5(hash_input.encode()).hexdigest()
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id FROM news WHERE content_hash = ?", (content_hash,))
-            result = cursor.fetchone()
-            conn.close()
+            updates.append((make_content_hash(hash_input), row_id))
+        
+        cursor.execute("BEGIN")
+        cursor.executemany("UPDATE OR IGNORE news SET content_hash = ? WHERE id = ?", updates)
+        cursor.execute("PRAGMA user_version = 1")
+        cursor.execute("COMMIT")
+    
+    def filter_new_articles(self, articles):
+        """Drop articles whose URL is already stored with content, with at most one query for the batch"""
+        try:
+            # Listings give no content to hash, so match on the URL exactly as prepare_row stores it
+            urls = [clean_text_for_db(article['url'])[:1000] for article in articles]
+            
+            # URLs saved by other processes aren't in memory; ask SQLite about those in one go
+            unknown = list({url for url in urls if url not in self._url_set})
+            if unknown:
+                placeholders = ",".join("?" * len(unknown))
+                self._url_set.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT url FROM news WHERE url IN ({placeholders}) AND content != ''", unknown
+                    )
+                )
             
-            return result is not None
+            return [article for article, url in zip(articles, urls) if url not in self._url_set]
             
         except Exception as e:
             logger.warning(f"Duplicate check failed: {e}")
-            return False
+            return articles
+    
+    def prepare_row(self, title, url, content, summarize, source):
+        """Clean inputs and build the news row tuple, content hash included; SQLite stamps scraped_date"""
+        # Clean all inputs before saving
+        clean_title = clean_text_for_db(title)[:500] if title else "AI News Article"
+        clean_url = clean_text_for_db(url)[:1000] if url else "https://unknown-source.com"
+        clean_content = clean_text_for_db(content)[:5000] if content else ""
+        clean_summary = clean_text_for_db(summarize)[:500] if summarize else "AI technology news update."
+        clean_source = clean_text_for_db(source)[:200] if source else "Unknown Source"
+        
+        # Create content hash for duplicate detection
+        content_snippet = clean_content[:200] if clean_content else clean_title
+        hash_input = f"{clean_title.lower().strip()}{content_snippet.lower().strip()}"
+        content_hash = make_content_hash(hash_input)
+        
+        return (
+            clean_title, clean_url, clean_content, clean_summary,
+            clean_source, content_hash
+        )
     
     def save_news(self, title, url, content, summarize, source):
         """Save one news article with summary - Enhanced error handling and validation"""
         try:
-            # Clean all inputs before saving
-            clean_title = clean_text_for_db(title)[:500] if title else "AI News Article"
-            clean_url = clean_text_for_db(url)[:1000] if url else "https://unknown-source.com"
-            clean_content = clean_text_for_db(content)[:5000] if content else ""
-            clean_summary = clean_text_for_db(summarize)[:500] if summarize else "AI technology news update."
-            clean_source = clean_text_for_db(source)[:200] if source else "Unknown Source"
-            
-            # Create content hash for duplicate detection
-            content_snippet = clean_content[:200] if clean_content else clean_title
-            hash_input = f"{clean_title.lower().strip()}{content_snippet.lower().strip()}"
-            content_hash = hashlib.md5(hash_input.encode()).hexdigest()
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # First, check if all required columns exist
-            cursor.execute("PRAGMA table_info(news)")
-            columns = [column[1] for column in cursor.fetchall()]
+            row = self.prepare_row(title, url, content, summarize, source)
             
-            # If summarize column is missing, add it
-            if 'summarize' not in columns:
-                cursor.execute("ALTER TABLE news ADD COLUMN summarize TEXT")
-                logger.info("🔧 Added missing 'summarize' column")
+            # Schema is verified once in init_database; a missing column lands in fix_database_and_retry
+            cursor = self._conn.cursor()
+            cursor.execute(_INSERT_NEWS_SQL, row)
             
-            if 'content_hash' not in columns:
-                cursor.execute("ALTER TABLE news ADD COLUMN content_hash TEXT")
-                logger.info("🔧 Added missing 'content_hash' column")
+            # Duplicates are skipped, or only have missing content filled in, instead of deleted and rewritten
+            if cursor.rowcount == 0:
+                logger.info(f"⏭️ Already saved: {row[0][:50]}...")
+                return False
             
-            # Insert the record
-            cursor.execute("""
-                INSERT OR REPLACE INTO news (title, url, content, summarize, source, scraped_date, content_hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                clean_title, clean_url, clean_content, clean_summary, 
-                clean_source, datetime.datetime.now().isoformat(), content_hash
-            ))
-            
-            conn.commit()
-            conn.close()
-            logger.info(f"💾 Saved successfully: {clean_title[:50]}...")
+            if row[2]:
+                self._url_set.add(row[1])
+            logger.info(f"💾 Saved successfully: {row[0][:50]}...")
             return True
             
         except sqlite3.OperationalError as e:
@@ -184,6 +301,28 @@ class SimpleNewsDB:
             logger.error(f"❌ Save error: {e}")
             return False
     
+    def save_news_many(self, articles):
+        """Save several (title, url, content, summarize, source) articles in one transaction; True if the first was written"""
+        try:
+            rows = [self.prepare_row(*article) for article in articles]
+            
+            self._conn.execute("BEGIN")
+            written = self._conn.execute(_INSERT_NEWS_SQL, rows[0]).rowcount
+            cursor = self._conn.executemany(_INSERT_NEWS_SQL, rows[1:])
+            self._conn.execute("COMMIT")
+            self._url_set.update(row[1] for row in rows if row[2])
+            
+            logger.info(f"💾 Saved or filled {written + max(cursor.rowcount, 0)} of {len(rows)} articles in one transaction")
+            if not written:
+                logger.info(f"⏭️ Already saved: {rows[0][0][:50]}...")
+            return written > 0
+            
+        except Exception as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.error(f"❌ Batch save error: {e}")
+            return False
+    
     def fix_database_and_retry(self, title, url, content, summarize, source):
         """Fix database structure and retry saving"""
         try:
@@ -206,93 +345,79 @@ async def human_delay(min_ms=1000, max_ms=3000):
     delay = random.randint(min_ms, max_ms) / 1000
     await asyncio.sleep(delay)
 
-def clean_text_for_db(text):
-    """Clean any text before database insertion"""
-    if not text:
-        return ""
-    
-    try:
-        text = str(text)
-        text = text.replace('\x00', '').replace('\r', ' ').replace('\n', ' ').replace('\t', ' ')
-        
-        replacements = {'"': '"', '"': '"', ''': "'", ''': "'", '–': '-', '—': '-', '…': '...'}
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        import re
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
-        text = ' '.join(text.split())
-        return text.strip()
-        
-    except Exception as e:
-        logger.error(f"Text cleaning failed: {e}")
-        return "Text cleaning failed"
+# Search engines rate-limit bots; everything else is fetched without a pause
+THROTTLED_HOSTS = ('google.com', 'bing.com')
+
+def needs_throttling(url):
+    """Whether a human-like pause is worth paying for before reading this URL"""
+    return any(host in url for host in THROTTLED_HOSTS)
+
+# Summary detection: one regex scan per category instead of a substring scan per keyword
+_COMPANY_RE = re.compile(r'\b(openai|google|microsoft|meta|apple|nvidia|amazon|anthropic|deepmind|tesla|salesforce)\b')
+_ACTION_RE = re.compile(r'\b(announce|launch|release|develop|create|introduce|unveil|reveal|debut|rollout)')
+_TOPIC_RE = re.compile(r'\b(artificial intelligence|generative ai|machine learning|chatgpt|gpt|ai|neural|llm|automation|robotics)s?\b')
+_ACTION_PAST = {
+    'announce': 'announced', 'launch': 'launched', 'release': 'released',
+    'develop': 'developed', 'create': 'created', 'introduce': 'introduced',
+    'unveil': 'unveiled', 'reveal': 'revealed', 'debut': 'debuted', 'rollout': 'rolled out'
+}
+_COMPANY_NAMES = {'openai': 'OpenAI', 'deepmind': 'DeepMind'}
+_TOPIC_LABELS = {
+    'gpt': "ChatGPT technology",
+    'chatgpt': "ChatGPT technology",
+    'machine learning': "machine learning capabilities",
+    'robotics': "robotics technology",
+    'automation': "automation solutions"
+}
 
 def create_crispy_summary(title, content):
     """Create a crispy, unique, and understandable summary"""
     try:
-        if not title:
-            title = "AI News Update"
-        if not content:
-            content = ""
-        
-        title_lower = title.lower()
-        content_lower = content.lower()
-        
-        # Enhanced detection
-        companies = ['openai', 'google', 'microsoft', 'meta', 'apple', 'nvidia', 'amazon', 'anthropic', 'deepmind', 'tesla', 'salesforce']
-        actions = ['announce', 'launch', 'release', 'develop', 'create', 'introduce', 'unveil', 'reveal', 'debut', 'rollout']
-        ai_topics = ['ai', 'artificial intelligence', 'gpt', 'chatgpt', 'machine learning', 'neural', 'llm', 'generative ai', 'automation', 'robotics']
-        
-        # Find elements
-        company = "A tech company"
-        for comp in companies:
-            if comp in title_lower or comp in content_lower:
-                company = comp.capitalize()
-                if comp == 'openai': company = 'OpenAI'
-                elif comp == 'deepmind': company = 'DeepMind'
-                break
-        
-        action = "introduced"
-        for act in actions:
-            if act in title_lower:
-                action = f"{act}d" if act.endswith('e') else f"{act}ed"
-                if act == 'announce': action = "announced"
-                elif act == 'launch': action = "launched"
-                elif act == 'release': action = "released"
-                break
-        
-        topic = "AI technology"
-        for ai_topic in ai_topics:
-            if ai_topic in title_lower or ai_topic in content_lower:
-                if 'gpt' in ai_topic or 'chatgpt' in ai_topic: topic = "ChatGPT technology"
-                elif 'machine learning' in ai_topic: topic = "machine learning capabilities"
-                elif 'robotics' in ai_topic: topic = "robotics technology"
-                elif 'automation' in ai_topic: topic = "automation solutions"
-                else: topic = "AI technology"
-                break
-        
-        # Create summary
-        summary = f"{company} has {action} new {topic}. "
-        
-        # Add dynamic impact
-        if any(word in title_lower for word in ['breakthrough', 'revolutionary', 'game-changing']):
-            summary += "This breakthrough could transform the tech industry."
-        elif any(word in title_lower for word in ['partnership', 'collaboration', 'deal']):
-            summary += "This partnership accelerates AI development progress."
-        elif any(word in title_lower for word in ['funding', 'investment', 'raises']):
-            summary += "This investment signals strong market confidence in AI."
-        elif any(word in title_lower for word in ['research', 'study', 'paper']):
-            summary += "This research advances our understanding of AI capabilities."
-        else:
-            summary += "This development marks continued innovation in artificial intelligence."
-        
-        return summary[:200] + "..." if len(summary) > 200 else summary
+        return _summarize_impl(title or "AI News Update", content or "")
         
     except Exception as e:
         logger.error(f"❌ Summary creation failed: {e}")
         return f"Latest AI technology update: {str(title)[:100]}. This represents new progress in artificial intelligence."
 
+@functools.lru_cache(maxsize=512)
+def _summarize_impl(title, content):
+    """Summary body, memoized since the result depends only on (title, content)"""
+    title_lower = title.lower()
+    content_lower = content.lower()
+    
+    # Find elements
+    company = "A tech company"
+    m = _COMPANY_RE.search(title_lower) or _COMPANY_RE.search(content_lower)
+    if m:
+        company = _COMPANY_NAMES.get(m.group(1), m.group(1).capitalize())
+    
+    action = "introduced"
+    m = _ACTION_RE.search(title_lower)
+    if m:
+        action = _ACTION_PAST[m.group(1)]
+    
+    topic = "AI technology"
+    m = _TOPIC_RE.search(title_lower) or _TOPIC_RE.search(content_lower)
+    if m:
+        topic = _TOPIC_LABELS.get(m.group(1), "AI technology")
+    
+    # Create summary
+    summary = f"{company} has {action} new {topic}. "
+    
+    # Add dynamic impact
+    if any(word in title_lower for word in ['breakthrough', 'revolutionary', 'game-changing']):
+        summary += "This breakthrough could transform the tech industry."
+    elif any(word in title_lower for word in ['partnership', 'collaboration', 'deal']):
+        summary += "This partnership accelerates AI development progress."
+    elif any(word in title_lower for word in ['funding', 'investment', 'raises']):
+        summary += "This investment signals strong market confidence in AI."
+    elif any(word in title_lower for word in ['research', 'study', 'paper']):
+        summary += "This research advances our understanding of AI capabilities."
+    else:
+        summary += "This development marks continued innovation in artificial intelligence."
+    
+    return summary[:200] + "..." if len(summary) > 200 else summary
+
 # Comprehensive news sources
 AI_NEWS_SOURCES = [
     {
@@ -336,18 +461,21 @@ async def extract_articles_from_source(page, source):
     """Extract articles from a specific source"""
     try:
         logger.info(f"🔍 Trying {source['name']}...")
-        await page.goto(source['url'], wait_until="networkidle", timeout=30000)
-        await human_delay(2000, 4000)
+        await page.goto(source['url'], wait_until="domcontentloaded", timeout=15000)
+        try:
+            await page.wait_for_selector("a", timeout=5000)
+        except Exception:
+            logger.warning(f"⚠️ {source['name']}: no links yet, extracting anyway")
+        if needs_throttling(source['url']):
+            await human_delay(500, 1500)
         
         # Handle consent popups
         try:
-            consent_selectors = ['button:has-text("Accept")', 'button:has-text("Agree")', '[id*="accept"]', '[class*="accept"]']
-            for selector in consent_selectors:
-                element = await page.query_selector(selector)
-                if element:
-                    await element.click()
-                    await human_delay(1000, 2000)
-                    break
+            # Grouped selector: one CDP round-trip, first match in document order
+            element = await page.query_selector('button:has-text("Accept"), button:has-text("Agree"), [id*="accept"], [class*="accept"]')
+            if element:
+                await element.click()
+                await human_delay(1000, 2000)
         except:
             pass
         
@@ -364,34 +492,25 @@ async def extract_articles_from_source(page, source):
                     '[data-testid*="headline"] a', '.title a'
                 ];
                 
-                for (const selector of selectors) {
-                    const links = document.querySelectorAll(selector);
+                // Compiled once; "ai" only as a whole word so "said" or "rain" don't count
+                const AI_RE = /\\bai\\b|artificial intelligence|machine learning|chatgpt|openai|\\btech|\\brobot|automation/i;
+                
+                // One grouped query walks the DOM once; links come back in document order
+                const links = document.querySelectorAll(selectors.join(','));
+                
+                for (const link of links) {
+                    const title = link.innerText || link.textContent || '';
+                    const url = link.href;
                     
-                    for (let i = 0; i < Math.min(links.length, 10); i++) {
-                        const link = links[i];
-                        const title = link.innerText || link.textContent || '';
-                        const url = link.href;
-                        
-                        if (title && url && title.length > 15 && title.length < 200) {
-                            const lowerTitle = title.toLowerCase();
-                            if (lowerTitle.includes('ai') || 
-                                lowerTitle.includes('artificial intelligence') ||
-                                lowerTitle.includes('machine learning') ||
-                                lowerTitle.includes('chatgpt') ||
-                                lowerTitle.includes('openai') ||
-                                lowerTitle.includes('tech') ||
-                                lowerTitle.includes('robot') ||
-                                lowerTitle.includes('automation')) {
-                                
-                                articles.push({
-                                    title: title.trim(),
-                                    url: url.startsWith('http') ? url : new URL(url, window.location.origin).href
-                                });
-                            }
+                    if (title && url && title.length > 15 && title.length < 200) {
+                        if (AI_RE.test(title)) {
+                            articles.push({
+                                title: title.trim(),
+                                url: url.startsWith('http') ? url : new URL(url, window.location.origin).href
+                            });
+                            if (articles.length >= 10) break;
                         }
                     }
-                    
-                    if (articles.length > 0) break;
                 }
                 
                 return articles;
@@ -404,12 +523,21 @@ async def extract_articles_from_source(page, source):
         logger.warning(f"⚠️ {source['name']} extraction failed: {e}")
         return []
 
+# Any of these means the article body has rendered
+CONTENT_WAIT_SELECTOR = "article, main, .article-content, .entry-content, .post-body, .story-body"
+
 async def get_article_content(page, article_url):
     """Extract content from article page"""
     try:
-        await page.goto(article_url, wait_until="networkidle", timeout=20000)
-        await human_delay(1000, 3000)
+        await page.goto(article_url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            await page.wait_for_selector(CONTENT_WAIT_SELECTOR, timeout=5000)
+        except Exception:
+            logger.warning("⚠️ Article body not found, extracting anyway")
+        if needs_throttling(article_url):
+            await human_delay(500, 1500)
         
+        # Text is capped in the page so the discarded tail never crosses CDP
         content = await page.evaluate("""
             () => {
                 const selectors = [
@@ -418,20 +546,27 @@ async def get_article_content(page, article_url):
                     '[class*="article-body"]', '[class*="post-content"]'
                 ];
                 
-                for (const selector of selectors) {
-                    const element = document.querySelector(selector);
-                    if (element) {
-                        const text = element.innerText || element.textContent || '';
-                        if (text.length > 200) {
-                            return text.trim();
-                        }
+                // One grouped query, then rank matches by selector priority so a specific
+                // .entry-content beats an enclosing main article; ties keep document order
+                let best = null;
+                let bestRank = selectors.length;
+                for (const element of document.querySelectorAll(selectors.join(','))) {
+                    const rank = selectors.findIndex(sel => element.matches(sel));
+                    if (rank >= bestRank) continue;
+                    const text = element.innerText || element.textContent || '';
+                    if (text.length > 200) {
+                        best = text;
+                        bestRank = rank;
                     }
                 }
+                if (best) {
+                    return best.trim().slice(0, 4000);
+                }
                 
                 // Fallback
                 const main = document.querySelector('main');
                 if (main) {
-                    return main.innerText.trim();
+                    return main.innerText.trim().slice(0, 4000);
                 }
                 
                 return document.body.innerText.trim().substring(0, 1000);
@@ -443,7 +578,69 @@ async def get_article_content(page, article_url):
         
     except Exception as e:
         logger.warning(f"Content extraction failed: {e}")
-        return "Content extraction failed", "Unknown"
+        return "", "Unknown"
+
+# Resources the text extractors never read
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_AD_HOSTS = ("googletagmanager", "doubleclick", "facebook.net", "google-analytics")
+
+async def block_heavy_resources(route):
+    """Abort images, fonts, media, CSS and ad/analytics requests"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_AD_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Sources scraped at the same time, each on its own page
+MAX_PARALLEL = 3
+
+async def collect_fresh_articles(pages, sources):
+    """Scrape sources in parallel, one worker per page, until a fresh article turns up"""
+    source_queue = asyncio.Queue()
+    for source in sources:
+        source_queue.put_nowait(source)
+    
+    found_articles = []
+    found = asyncio.Event()
+    
+    async def worker(page):
+        while not found.is_set() and not source_queue.empty():
+            source = source_queue.get_nowait()
+            try:
+                articles = await extract_articles_from_source(page, source)
+                
+                # Skip duplicates, checked for the whole batch at once
+                for article in db.filter_new_articles(articles):
+                    # Stop after finding 3 fresh articles
+                    if len(found_articles) >= 3:
+                        break
+                    
+                    found_articles.append({
+                        **article,
+                        'source_name': source['name']
+                    })
+                    logger.info(f"✅ Found fresh article: {article['title'][:50]}...")
+                
+                if found_articles:
+                    found.set()
+                    
+            except Exception as e:
+                logger.warning(f"Source {source['name']} failed: {e}")
+    
+    workers = [asyncio.create_task(worker(page)) for page in pages]
+    all_done = asyncio.gather(*workers, return_exceptions=True)
+    found_waiter = asyncio.create_task(found.wait())
+    
+    # Return as soon as something fresh is found, or when every source has been tried
+    await asyncio.wait({all_done, found_waiter}, return_when=asyncio.FIRST_COMPLETED)
+    
+    found_waiter.cancel()
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, found_waiter, return_exceptions=True)
+    
+    return found_articles
 
 async def search_fresh_ai_news():
     """Search for fresh AI news - GUARANTEED to find something"""
@@ -452,42 +649,22 @@ async def search_fresh_ai_news():
     try:
         async with async_playwright() as p:
             browser = await p.chromium.launch(
-                headless=False,
-                args=['--no-sandbox', '--disable-web-security', '--disable-blink-features=AutomationControlled']
+                headless=True,
+                args=['--no-sandbox', '--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage', '--disable-gpu']
             )
             
             context = await browser.new_context(
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
             
-            page = await context.new_page()
+            # Extractors only read text, so skip heavy and tracking resources on every page
+            await context.route("**/*", block_heavy_resources)
             
-            found_articles = []
+            # One page per parallel worker; the first is reused for the article itself
+            pages = [await context.new_page() for _ in range(MAX_PARALLEL)]
+            page = pages[0]
             
-            # Try all sources until we find fresh content
-            for source in AI_NEWS_SOURCES:
-                try:
-                    articles = await extract_articles_from_source(page, source)
-                    
-                    for article in articles:
-                        # Check if it's a duplicate
-                        if not db.is_duplicate(article['title'], ""):
-                            found_articles.append({
-                                **article,
-                                'source_name': source['name']
-                            })
-                            logger.info(f"✅ Found fresh article: {article['title'][:50]}...")
-                        
-                        # Stop after finding 3 fresh articles
-                        if len(found_articles) >= 3:
-                            break
-                    
-                    if len(found_articles) >= 1:
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Source {source['name']} failed: {e}")
-                    continue
+            found_articles = await collect_fresh_articles(pages, AI_NEWS_SOURCES)
             
             # If no fresh articles found, create a time-based unique article
             if not found_articles:
@@ -507,7 +684,9 @@ async def search_fresh_ai_news():
             logger.info("📖 Getting full content...")
             try:
                 content, source = await get_article_content(page, selected_article['url'])
+                extracted = bool(content)
             except:
+                extracted = False
                 content = f"Fresh AI news from {selected_article['source_name']}. This article discusses the latest developments in artificial intelligence technology, including new breakthroughs in machine learning, natural language processing, and AI applications across various industries."
                 source = selected_article['source_name']
             
@@ -518,30 +697,38 @@ async def search_fresh_ai_news():
             logger.info("✨ Creating crispy summary...")
             summary = create_crispy_summary(selected_article['title'], content)
             
+            # The other fresh finds are saved title-only alongside it; like a failed scrape, their
+            # empty content leaves them selectable so a later run fills it in
+            articles_to_save = [(
+                selected_article['title'], selected_article['url'],
+                content if extracted else "", summary, source
+            )]
+            for article in found_articles[1:]:
+                articles_to_save.append((
+                    article['title'], article['url'], "",
+                    create_crispy_summary(article['title'], ""), article['source_name']
+                ))
+            
             # Save to database
             logger.info("💾 Saving fresh AI news...")
-            success = db.save_news(
-                title=selected_article['title'],
-                url=selected_article['url'],
-                content=content,
-                summarize=summary,
-                source=source
-            )
+            success = db.save_news_many(articles_to_save)
             
             if success:
-                print("\n" + "="*70)
-                print("🔥 FRESH AI NEWS FOUND AND SAVED!")
-                print("="*70)
-                print(f"📰 Title: {selected_article['title']}")
-                print(f"🌐 Source: {source}")
-                print(f"🔗 URL: {selected_article['url']}")
-                print(f"📝 Content: {len(content)} characters")
-                print(f"✨ Summary: {summary}")
-                print(f"💾 Saved to: {db.db_path}")
-                print(f"🚀 Found via: {selected_article['source_name']}")
-                print("="*70)
+                sys.stdout.write("\n".join([
+                    "\n" + "="*70,
+                    "🔥 FRESH AI NEWS FOUND AND SAVED!",
+                    "="*70,
+                    f"📰 Title: {selected_article['title']}",
+                    f"🌐 Source: {source}",
+                    f"🔗 URL: {selected_article['url']}",
+                    f"📝 Content: {len(content)} characters",
+                    f"✨ Summary: {summary}",
+                    f"💾 Saved to: {db.db_path}",
+                    f"🚀 Found via: {selected_article['source_name']}",
+                    "="*70
+                ]) + "\n")
             else:
-                print("❌ Failed to save article")
+                print("❌ Article not saved (already stored or save error)")
             
             await human_delay(2000, 3000)
             await browser.close()
@@ -575,44 +762,43 @@ def create_fallback_article():
     )
     
     if success:
-        print("\n" + "="*70)
-        print("🔥 AI NEWS UPDATE CREATED!")
-        print("="*70)
-        print(f"📰 Title: {fallback_title}")
-        print(f"🌐 Source: AI Update Service")
-        print(f"📝 Content: {len(fallback_content)} characters")
-        print(f"✨ Summary: {fallback_summary}")
-        print(f"💾 Saved to: {db.db_path}")
-        print("="*70)
+        sys.stdout.write("\n".join([
+            "\n" + "="*70,
+            "🔥 AI NEWS UPDATE CREATED!",
+            "="*70,
+            f"📰 Title: {fallback_title}",
+            f"🌐 Source: AI Update Service",
+            f"📝 Content: {len(fallback_content)} characters",
+            f"✨ Summary: {fallback_summary}",
+            f"💾 Saved to: {db.db_path}",
+            "="*70
+        ]) + "\n")
 
 # View saved news function
 def view_saved_news():
     """View saved news with summaries"""
     try:
-        conn = sqlite3.connect("ai_news.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        articles = db._conn.execute("""
             SELECT title, url, source, scraped_date, content, summarize 
             FROM news 
             ORDER BY created_at DESC 
             LIMIT 10
-        """)
-        
-        articles = cursor.fetchall()
-        conn.close()
+        """).fetchall()
         
         if articles:
-            print(f"\n📚 SAVED AI NEWS ({len(articles)} articles):")
-            print("="*70)
+            output = [f"\n📚 SAVED AI NEWS ({len(articles)} articles):", "="*70]
             
             for i, (title, url, source, date, content, summary) in enumerate(articles, 1):
-                print(f"\n{i}. 📰 {title}")
-                print(f"   🌐 Source: {source}")
-                print(f"   📅 Date: {date[:10]}")
-                print(f"   🔗 URL: {url}")
-                print(f"   ✨ Summary: {summary}")
-                print(f"   📊 Content: {len(content) if content else 0} characters")
+                output += [
+                    f"\n{i}. 📰 {title}",
+                    f"   🌐 Source: {source}",
+                    f"   📅 Date: {date[:10]}",
+                    f"   🔗 URL: {url}",
+                    f"   ✨ Summary: {summary}",
+                    f"   📊 Content: {len(content) if content else 0} characters"
+                ]
+            
+            sys.stdout.write("\n".join(output) + "\n")
         else:
             print("📭 No saved articles found")
             
@@ -621,13 +807,15 @@ def view_saved_news():
 
 # Main execution
 if __name__ == "__main__":
-    print("🤖 Always-Find AI News Agent")
-    print("="*35)
-    print("🔥 GUARANTEED to find fresh AI news")
-    print("📊 Auto-generate crispy summaries")
-    print("🚫 Never shows 'No news found'")
-    print("💾 Save to SQLite database")
-    print("="*35)
+    sys.stdout.write("\n".join([
+        "🤖 Always-Find AI News Agent",
+        "="*35,
+        "🔥 GUARANTEED to find fresh AI news",
+        "📊 Auto-generate crispy summaries",
+        "🚫 Never shows 'No news found'",
+        "💾 Save to SQLite database",
+        "="*35
+    ]) + "\n")
     
     try:
         if len(os.sys.argv) > 1: